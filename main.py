@@ -2,28 +2,68 @@ import sys
 import os
 import re
 import ssl
+import time
+import random
+import asyncio
+import functools
 import logging
-from googleapiclient.discovery import build
+import threading
+import aiohttp
+import diskcache
 import pandas as pd
 from datetime import datetime
+from urllib.parse import urlparse
 import numpy as np
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
     QComboBox, QMessageBox, QPlainTextEdit, QHBoxLayout, QScrollArea,
-    QSplitter, QLineEdit, QToolTip
+    QSplitter, QLineEdit, QToolTip, QMenuBar
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QDate
+from PyQt6.QtCore import Qt, QMetaObject, Q_ARG, pyqtSlot, QDate, QPointF
 from PyQt6.QtGui import QPalette, QColor, QFont, QCursor, QPainter
 from PyQt6.QtCharts import (
     QChart, QChartView, QLineSeries, QDateTimeAxis, QValueAxis, QLegend
 )
 from PyQt6.QtWidgets import QGraphicsDropShadowEffect
+from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 
 import openpyxl
 from openpyxl.chart import LineChart, Reference
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.styles import Font
+from openpyxl.cell import WriteOnlyCell
+
+
+# Base URL for the YouTube Data API v3 REST endpoints
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+
+# Maximum number of YouTube API requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Retry policy for rate-limited or failing API requests
+MAX_RETRIES = 6
+MAX_BACKOFF_SECONDS = 30
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+QUOTA_REASONS = {'quotaExceeded', 'dailyLimitExceeded'}
+
+# Maximum number of points drawn per chart series; larger series are decimated
+MAX_CHART_POINTS = 2000
+
+# Accepted channel URL prefix
+_YOUTUBE_URL_RE = re.compile(r'^https?://(www\.)?youtube\.com/')
+
+# Charts with more videos than this are rendered with OpenGL and without point markers
+OPENGL_POINT_THRESHOLD = 500
+
+# Characters that are not allowed in exported filenames
+_BAD_FILENAME_CHARS = str.maketrans('', '', '\\/*?:"<>|')
+
+# On-disk cache for channel ID lookups and video statistics
+CACHE = diskcache.Cache('.ytcache')
+CHANNEL_ID_TTL = 60 * 60  # 1 hour
+VIDEO_STATS_TTL = 3 * 24 * 60 * 60  # 3 days
 
 
 # Configure logging
@@ -36,8 +76,9 @@ logging.basicConfig(
 
 
 # Function to read API key from api.txt
+@functools.lru_cache(maxsize=1)
 def get_api_key():
-    """Reads the API key from the api.txt file."""
+    """Reads the API key from the api.txt file. The key is read once and cached."""
     try:
         with open('api.txt', 'r') as f:
             api_key = f.read().strip()
@@ -52,25 +93,117 @@ def get_api_key():
         raise e
 
 
+# Lazily created so it binds to the event loop that runs the requests
+_request_semaphore = None
+
+
+def get_request_semaphore():
+    """Returns the semaphore that bounds concurrent YouTube API requests."""
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return _request_semaphore
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with jitter, capped at MAX_BACKOFF_SECONDS."""
+    return min(2 ** attempt + random.random(), MAX_BACKOFF_SECONDS)
+
+
+class RetryableAPIError(Exception):
+    """Raised for API responses that may succeed if the request is repeated."""
+
+
+class QuotaExceededError(Exception):
+    """Raised when the API key's quota is exhausted; no further request can succeed."""
+
+
+def retry(exc_types, tries=MAX_RETRIES):
+    """Decorator that retries a coroutine on the given exceptions with exponential backoff."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(tries):
+                try:
+                    return await func(*args, **kwargs)
+                except exc_types as e:
+                    if attempt == tries - 1:
+                        logging.critical(f"Max retries reached for {func.__name__}: {e}")
+                        raise e
+                    delay = backoff_delay(attempt)
+                    logging.error(f"{type(e).__name__}: {e}. Retrying in {delay:.1f}s... "
+                                  f"Attempts left: {tries - attempt - 1}")
+                    await asyncio.sleep(delay)
+        return wrapper
+    return decorator
+
+
+# Function to issue a single YouTube Data API request
+@retry((RetryableAPIError, ssl.SSLError, aiohttp.ClientConnectionError))
+async def fetch_json(session, api_key, endpoint, params):
+    """Performs a GET request against a YouTube Data API endpoint and returns the decoded JSON.
+
+    Rate-limit and server errors are retried with exponential backoff; quota
+    exhaustion is raised immediately since retrying cannot succeed.
+    """
+    url = f"{YOUTUBE_API_URL}/{endpoint}"
+    query = {k: v for k, v in params.items() if v is not None}
+    query['key'] = api_key
+
+    async with get_request_semaphore():
+        async with session.get(url, params=query) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                # Gateway errors may come back as HTML rather than JSON
+                data = {}
+            if response.status == 200:
+                return data
+
+            error = data.get('error', {})
+            message = f"YouTube API error ({response.status}) on {endpoint}: {error.get('message', response.reason)}"
+            reasons = {e.get('reason') for e in error.get('errors', [])}
+            if reasons & QUOTA_REASONS:
+                raise QuotaExceededError(message)
+            if response.status in RETRY_STATUSES or (response.status == 403 and reasons & RETRY_REASONS):
+                raise RetryableAPIError(message)
+            raise ValueError(message)
+
+
 # Function to extract channel ID from URL
-def extract_channel_id(youtube, url):
-    """Extracts the channel ID from a YouTube channel URL."""
+async def extract_channel_id(session, api_key, url):
+    """Extracts the channel ID from a YouTube channel URL, using the on-disk cache when possible."""
+    cache_key = ('cid', url)
+    channel_id = CACHE.get(cache_key)
+    if channel_id:
+        logging.debug(f"Channel ID for {url} found in cache: {channel_id}")
+        return channel_id
+    channel_id = await resolve_channel_id(session, api_key, url)
+    CACHE.set(cache_key, channel_id, expire=CHANNEL_ID_TTL)
+    return channel_id
+
+
+async def resolve_channel_id(session, api_key, url):
+    """Resolves the channel ID for a YouTube channel URL via the API."""
     try:
-        if '/channel/' in url:
+        # Query strings and fragments are ignored; only the path is used
+        parts = urlparse(url).path.strip('/').split('/')
+        has_name = len(parts) > 1 and parts[1] != ''
+        if parts[0] == 'channel' and has_name:
             # URL contains the channel ID directly
-            channel_id = url.split('/channel/')[-1].split('/')[0]
+            channel_id = parts[1]
             logging.debug(f"Extracted Channel ID from URL: {channel_id}")
             return channel_id
-        elif '/user/' in url or '/c/' in url:
+        elif parts[0] in ('user', 'c') and has_name:
             # Need to resolve the custom URL to get the channel ID
-            username = url.rstrip('/').split('/')[-1]
+            username = parts[1]
             logging.debug(f"Resolving custom URL for username: {username}")
             # Use channels.list with forUsername
-            request = youtube.channels().list(
-                part='id',
-                forUsername=username
-            )
-            response = request.execute()
+            response = await fetch_json(session, api_key, 'channels', {
+                'part': 'id',
+                'forUsername': username,
+                'fields': 'items/id'
+            })
             if 'items' in response and response['items']:
                 channel_id = response['items'][0]['id']
                 logging.debug(f"Resolved Channel ID using forUsername: {channel_id}")
@@ -78,31 +211,31 @@ def extract_channel_id(youtube, url):
             else:
                 # Try searching by custom URL
                 logging.debug(f"forUsername did not return results for {username}. Trying search.")
-                request = youtube.search().list(
-                    part='snippet',
-                    q=username,
-                    type='channel',
-                    maxResults=1
-                )
-                response = request.execute()
+                response = await fetch_json(session, api_key, 'search', {
+                    'part': 'snippet',
+                    'q': username,
+                    'type': 'channel',
+                    'maxResults': 1,
+                    'fields': 'items/snippet/channelId'
+                })
                 if 'items' in response and response['items']:
                     channel_id = response['items'][0]['snippet']['channelId']
                     logging.debug(f"Resolved Channel ID using search: {channel_id}")
                     return channel_id
                 else:
                     raise ValueError(f"Channel not found for URL: {url}")
-        elif '/@' in url:
+        elif parts[0].startswith('@'):
             # Handle @username URLs
-            handle = url.rstrip('/').split('/')[-1]
+            handle = parts[0]
             logging.debug(f"Resolving handle: {handle}")
             # Use search.list to find the channel by handle
-            request = youtube.search().list(
-                part='snippet',
-                q=handle,
-                type='channel',
-                maxResults=1
-            )
-            response = request.execute()
+            response = await fetch_json(session, api_key, 'search', {
+                'part': 'snippet',
+                'q': handle,
+                'type': 'channel',
+                'maxResults': 1,
+                'fields': 'items/snippet/channelId'
+            })
             if 'items' in response and response['items']:
                 channel_id = response['items'][0]['snippet']['channelId']
                 logging.debug(f"Resolved Channel ID using handle: {channel_id}")
@@ -116,14 +249,14 @@ def extract_channel_id(youtube, url):
         raise e
 
 
-def get_uploads_playlist_id(youtube, channel_id):
+async def get_uploads_playlist_id(session, api_key, channel_id):
     """Retrieve the uploads playlist ID for a given channel."""
     try:
-        request = youtube.channels().list(
-            part='contentDetails,snippet',
-            id=channel_id
-        )
-        response = request.execute()
+        response = await fetch_json(session, api_key, 'channels', {
+            'part': 'contentDetails,snippet',
+            'id': channel_id,
+            'fields': 'items(id,snippet/title,contentDetails/relatedPlaylists/uploads)'
+        })
         if 'items' in response and response['items']:
             uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
             channel_title = response['items'][0]['snippet']['title']
@@ -136,201 +269,273 @@ def get_uploads_playlist_id(youtube, channel_id):
         raise e
 
 
-def get_all_video_ids(youtube, uploads_playlist_id):
-    """Retrieve all video IDs from the uploads playlist."""
+async def get_all_video_ids(session, api_key, uploads_playlist_id, queue=None):
+    """Retrieve all video IDs from the uploads playlist.
+
+    Playlist pages can only be walked one at a time via nextPageToken, so when a
+    queue is given each page of IDs is pushed onto it as soon as it arrives,
+    letting statistics requests run while the remaining pages are fetched.
+    """
     video_ids = []
     next_page_token = None
-    retries = 3
 
-    while True:
-        try:
-            request = youtube.playlistItems().list(
-                part='contentDetails',
-                playlistId=uploads_playlist_id,
-                maxResults=50,
-                pageToken=next_page_token
-            )
-            response = request.execute()
+    try:
+        while True:
+            response = await fetch_json(session, api_key, 'playlistItems', {
+                'part': 'contentDetails',
+                'playlistId': uploads_playlist_id,
+                'maxResults': 50,
+                'pageToken': next_page_token,
+                'fields': 'items/contentDetails/videoId,nextPageToken'
+            })
 
             if 'items' not in response:
                 break
 
-            for item in response['items']:
-                video_ids.append(item['contentDetails']['videoId'])
+            page_ids = [item['contentDetails']['videoId'] for item in response['items']]
+            video_ids.extend(page_ids)
+            if queue is not None and page_ids:
+                await queue.put(page_ids)
 
             next_page_token = response.get('nextPageToken')
             if not next_page_token:
                 break
-        except ssl.SSLError as ssl_err:
-            logging.error(f"SSL Error: {ssl_err}. Retrying...")
-            retries -= 1
-            if retries > 0:
-                logging.info(f"Retrying... Attempts left: {retries}")
-                continue
-            else:
-                logging.critical("Max retries reached for SSL errors.")
-                raise ssl_err
-        except Exception as e:
-            logging.error(f"An error occurred while fetching all video IDs: {e}")
-            raise e
+    except Exception as e:
+        logging.error(f"An error occurred while fetching all video IDs: {e}")
+        raise e
+    finally:
+        if queue is not None:
+            # Signal the consumer that no more pages are coming
+            await queue.put(None)
 
     logging.debug(f"Total Videos Retrieved (All): {len(video_ids)}")
     return video_ids
 
 
-def get_last_n_video_ids(youtube, uploads_playlist_id, n=50):
-    """Retrieve the last n video IDs from the uploads playlist."""
+async def get_last_n_video_ids(session, api_key, uploads_playlist_id, n=50, queue=None):
+    """Retrieve the last n video IDs from the uploads playlist.
+
+    As with get_all_video_ids, each page of IDs is pushed onto the queue when
+    one is given.
+    """
     video_ids = []
     next_page_token = None
-    retries = 3
 
-    while len(video_ids) < n:
-        try:
-            request = youtube.playlistItems().list(
-                part='contentDetails',
-                playlistId=uploads_playlist_id,
-                maxResults=min(n - len(video_ids), 50),
-                pageToken=next_page_token
-            )
-            response = request.execute()
+    try:
+        while len(video_ids) < n:
+            response = await fetch_json(session, api_key, 'playlistItems', {
+                'part': 'contentDetails',
+                'playlistId': uploads_playlist_id,
+                'maxResults': min(n - len(video_ids), 50),
+                'pageToken': next_page_token,
+                'fields': 'items/contentDetails/videoId,nextPageToken'
+            })
 
             if 'items' not in response:
                 break
 
-            for item in response['items']:
-                video_ids.append(item['contentDetails']['videoId'])
-                if len(video_ids) == n:
-                    break
+            page_ids = [item['contentDetails']['videoId'] for item in response['items']][:n - len(video_ids)]
+            video_ids.extend(page_ids)
+            if queue is not None and page_ids:
+                await queue.put(page_ids)
 
             next_page_token = response.get('nextPageToken')
             if not next_page_token:
                 break
-        except ssl.SSLError as ssl_err:
-            logging.error(f"SSL Error: {ssl_err}. Retrying...")
-            retries -= 1
-            if retries > 0:
-                logging.info(f"Retrying... Attempts left: {retries}")
-                continue
-            else:
-                logging.critical("Max retries reached for SSL errors.")
-                raise ssl_err
-        except Exception as e:
-            logging.error(f"An error occurred while fetching last {n} video IDs: {e}")
-            raise e
+    except Exception as e:
+        logging.error(f"An error occurred while fetching last {n} video IDs: {e}")
+        raise e
+    finally:
+        if queue is not None:
+            # Signal the consumer that no more pages are coming
+            await queue.put(None)
 
     logging.debug(f"Total Videos Retrieved (Last {n}): {len(video_ids)}")
     return video_ids
 
 
-def get_videos_statistics(youtube, video_ids):
-    """Retrieve statistics for a list of video IDs."""
-    statistics = []
-    # YouTube API allows up to 50 IDs per request
-    for i in range(0, len(video_ids), 50):
-        batch_ids = video_ids[i:i+50]
-        try:
-            request = youtube.videos().list(
-                part='statistics, snippet',
-                id=','.join(batch_ids)
-            )
-            response = request.execute()
-
-            if 'items' in response:
-                for item in response['items']:
-                    video_id = item['id']
-                    view_count = int(item['statistics'].get('viewCount', 0))
-                    upload_date = item['snippet']['publishedAt']
-                    title = item['snippet']['title']
-                    statistics.append({
-                        'video_id': video_id,
-                        'title': title,
-                        'view_count': view_count,
-                        'upload_date': upload_date
-                    })
-        except ssl.SSLError as ssl_err:
-            logging.error(f"SSL Error while fetching video statistics: {ssl_err}. Retrying...")
-            retries = 3
-            while retries > 0:
-                try:
-                    request = youtube.videos().list(
-                        part='statistics, snippet',
-                        id=','.join(batch_ids)
-                    )
-                    response = request.execute()
-
-                    if 'items' in response:
-                        for item in response['items']:
-                            video_id = item['id']
-                            view_count = int(item['statistics'].get('viewCount', 0))
-                            upload_date = item['snippet']['publishedAt']
-                            title = item['snippet']['title']
-                            statistics.append({
-                                'video_id': video_id,
-                                'title': title,
-                                'view_count': view_count,
-                                'upload_date': upload_date
-                            })
-                    break  # Exit retry loop if successful
-                except ssl.SSLError as ssl_err_retry:
-                    retries -= 1
-                    logging.error(f"Retry SSL Error: {ssl_err_retry}. Attempts left: {retries}")
-                    if retries == 0:
-                        logging.critical("Max retries reached for SSL errors during video statistics fetching.")
-                        raise ssl_err_retry
-                except Exception as e:
-                    logging.error(f"An error occurred while fetching video statistics: {e}")
-                    break
-        except Exception as e:
-            logging.error(f"An error occurred while fetching video statistics: {e}")
-            continue
-
-    logging.debug(f"Total Videos with Statistics Retrieved: {len(statistics)}")
-    return statistics
+async def fetch_videos_batch(session, api_key, batch_ids):
+    """Retrieve statistics for a single batch of up to 50 video IDs.
 
+    Statistics already in the on-disk cache are reused; only the missing IDs
+    are requested from the API.
+    """
+    statistics = []
+    missing_ids = []
+    for video_id in batch_ids:
+        stat = CACHE.get(('stats', video_id))
+        if stat is not None:
+            statistics.append(stat)
+        else:
+            missing_ids.append(video_id)
 
-class WorkerThread(QThread):
-    progress = pyqtSignal(str)
-    finished = pyqtSignal(object)
+    if not missing_ids:
+        return statistics
 
-    def __init__(self, youtube, channel_url, n_videos):
-        super().__init__()
-        self.youtube = youtube
-        self.channel_url = channel_url
-        self.n_videos = n_videos
+    try:
+        response = await fetch_json(session, api_key, 'videos', {
+            'part': 'statistics,snippet',
+            'id': ','.join(missing_ids),
+            'fields': 'items(id,snippet(title,publishedAt),statistics/viewCount)'
+        })
 
-    def run(self):
-        try:
-            self.progress.emit(f"Processing channel: {self.channel_url}")
-            channel_id = extract_channel_id(self.youtube, self.channel_url)
-            self.progress.emit(f"Extracted Channel ID: {channel_id}")
+        if 'items' in response:
+            for item in response['items']:
+                stat = {
+                    'video_id': item['id'],
+                    'title': item['snippet']['title'],
+                    'view_count': int(item['statistics'].get('viewCount', 0)),
+                    'upload_date': item['snippet']['publishedAt']
+                }
+                CACHE.set(('stats', stat['video_id']), stat, expire=VIDEO_STATS_TTL)
+                statistics.append(stat)
+    except QuotaExceededError as e:
+        # Fatal for the whole analysis, not just this batch
+        logging.error(f"Quota exceeded while fetching video statistics: {e}")
+        raise e
+    except Exception as e:
+        logging.error(f"An error occurred while fetching video statistics: {e}")
+    return statistics
 
-            uploads_playlist_id, channel_title = get_uploads_playlist_id(self.youtube, channel_id)
-            self.progress.emit(f"Channel Title: {channel_title}")
 
-            if self.n_videos == "all":
-                self.progress.emit("Fetching all video IDs...")
-                video_ids = get_all_video_ids(self.youtube, uploads_playlist_id)
-                self.progress.emit(f"Total Videos Retrieved: {len(video_ids)}")
-            else:
-                self.progress.emit("Fetching video IDs...")
-                video_ids = get_last_n_video_ids(self.youtube, uploads_playlist_id, n=self.n_videos)
-                self.progress.emit(f"Total Videos Retrieved: {len(video_ids)}")
-
-            self.progress.emit("Fetching video statistics...")
-            video_stats = get_videos_statistics(self.youtube, video_ids)
-            self.progress.emit("Video statistics retrieved.")
-            data = {
-                'channel_title': channel_title,
-                'video_stats': video_stats
-            }
-            self.finished.emit(data)
-        except Exception as e:
-            self.finished.emit({'error': str(e)})
+def allocate_video_stats(capacity):
+    """Preallocates one typed column per statistic for up to capacity videos."""
+    return {
+        'video_id': np.empty(capacity, dtype=object),
+        'title': np.empty(capacity, dtype=object),
+        'view_count': np.empty(capacity, dtype=np.int64),
+        'upload_date': np.empty(capacity, dtype=object)  # Raw timestamps, parsed once when finalized
+    }
+
+
+def store_video_stats(columns, count, batch):
+    """Writes a batch of statistics into the columns starting at count and returns the new count.
+
+    Callers preallocate room for every requested ID, and a batch never returns
+    more statistics than the IDs it was given.
+    """
+    needed = count + len(batch)
+    assert needed <= len(columns['video_id']), "video stats columns were under-allocated"
+    for i, stat in enumerate(batch, start=count):
+        columns['video_id'][i] = stat['video_id']
+        columns['title'][i] = stat['title']
+        columns['view_count'][i] = stat['view_count']
+        # numpy does not accept the trailing UTC designator
+        columns['upload_date'][i] = stat['upload_date'].rstrip('Z')
+    return needed
+
+
+def finalize_video_stats(columns, count):
+    """Trims the columns to count entries and parses upload dates in one vectorized call."""
+    stats = {name: column[:count] for name, column in columns.items()}
+    stats['upload_date'] = np.array(stats['upload_date'].tolist(), dtype='datetime64[ns]')
+    logging.debug(f"Total Videos with Statistics Retrieved: {count}")
+    return stats
+
+
+async def stream_videos_statistics(session, api_key, queue):
+    """Retrieve statistics for batches of video IDs as they are pushed onto the queue.
+
+    A batch that fails fatally (e.g. quota exhaustion) stops the consumer and
+    cancels every outstanding batch.
+    """
+    tasks = []
+    try:
+        while (batch_ids := await queue.get()) is not None:
+            # Stop issuing requests as soon as an earlier batch has failed
+            for task in tasks:
+                if task.done() and task.exception() is not None:
+                    raise task.exception()
+            tasks.append(asyncio.create_task(fetch_videos_batch(session, api_key, batch_ids)))
+
+        columns = allocate_video_stats(len(tasks) * 50)
+        count = 0
+        for batch in asyncio.as_completed(tasks):
+            count = store_video_stats(columns, count, await batch)
+        return finalize_video_stats(columns, count)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def moving_average(values, window):
+    """Trailing rolling mean computed in a single pass from a cumulative sum.
+
+    The first window - 1 positions are NaN, matching pandas' rolling().mean().
+    """
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(values.shape, np.nan)
+    if window > len(values):
+        return result
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    result[window - 1:] = (cumsum[window:] - cumsum[:-window]) / window
+    return result
+
+
+def lttb_indices(x, y, n_out):
+    """Selects n_out indices with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    selected point and the average of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs((x[selected] - avg_x) * (y[start:end] - y[selected])
+                       - (x[selected] - x[start:end]) * (avg_y - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+    return indices
+
+
+def chart_points(x, y, max_points=MAX_CHART_POINTS):
+    """Builds the QPointF list for a series, decimating to at most max_points."""
+    if len(x) > max_points:
+        idx = lttb_indices(x, y, max_points)
+        x, y = x[idx], y[idx]
+    return [QPointF(float(px), float(py)) for px, py in zip(x, y)]
 
 
 class InteractiveChartView(QChartView):
     def __init__(self, chart, parent=None):
         super().__init__(chart, parent)
+        # Full-resolution data for series that are decimated for display
+        self.tracked_series = []
+        self._refreshing = False
+
+    def track_series(self, series, x, y):
+        """Keeps the full data of a series so it can be re-decimated for the visible range."""
+        self.tracked_series.append((series, x, y))
+
+    def refresh_visible_points(self, range_min, range_max):
+        """Re-decimates tracked series to the visible x range after a zoom or reset."""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        try:
+            lo = range_min.toMSecsSinceEpoch()
+            hi = range_max.toMSecsSinceEpoch()
+            for series, x, y in self.tracked_series:
+                # Keep one point beyond each edge so lines run to the border
+                start = max(int(np.searchsorted(x, lo, side='left')) - 1, 0)
+                end = min(int(np.searchsorted(x, hi, side='right')) + 1, len(x))
+                series.replace(chart_points(x[start:end], y[start:end]))
+        finally:
+            self._refreshing = False
 
     def mouseDoubleClickEvent(self, event):
         self.chart().zoomReset()
@@ -348,6 +553,13 @@ class YouTubeViewStatsApp(QWidget):
         self.setStyleSheet("background-color: #2E2E2E; color: #FFFFFF;")
         self.setPalette(self.create_dark_palette())
 
+        # Menu bar with cache management
+        menu_bar = QMenuBar()
+        cache_menu = menu_bar.addMenu("Cache")
+        clear_cache_action = cache_menu.addAction("Clear Cache")
+        clear_cache_action.triggered.connect(self.clear_cache)
+        self.layout.setMenuBar(menu_bar)
+
         # Splitter to divide input area and terminal
         splitter = QSplitter(Qt.Orientation.Horizontal)
 
@@ -452,18 +664,25 @@ class YouTubeViewStatsApp(QWidget):
         # Set the main layout
         self.setLayout(self.layout)
 
-        # Initialize YouTube API client
+        # Load the YouTube API key
         try:
-            api_key = get_api_key()
-            self.youtube = build('youtube', 'v3', developerKey=api_key)
-            logging.info("YouTube API client initialized successfully.")
+            self.api_key = get_api_key()
+            logging.info("YouTube API key loaded successfully.")
         except Exception as e:
-            logging.critical(f"Failed to initialize YouTube API client: {e}")
+            logging.critical(f"Failed to load YouTube API key: {e}")
             QMessageBox.critical(self, "Error", str(e))
             sys.exit()
 
-        # List to keep track of worker threads
-        self.worker_threads = []
+        # Tooltip font is created once rather than on every hover event
+        self._tooltip_font = QFont('SansSerif', 10)
+        QToolTip.setFont(self._tooltip_font)
+
+        # Background event loop shared by all analyses
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        # HTTP session shared by all analyses; only ever touched from the loop thread
+        self._session = None
 
         # Variables to store the latest DataFrame for export
         self.latest_df = None
@@ -487,6 +706,7 @@ class YouTubeViewStatsApp(QWidget):
         palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.white)
         return palette
 
+    @pyqtSlot(str)
     def log(self, message):
         self.terminal.appendPlainText(message)
         logging.info(message)
@@ -498,7 +718,7 @@ class YouTubeViewStatsApp(QWidget):
             return
 
         # Validate the URL format
-        if not re.match(r'^https?://(www\.)?youtube\.com/', channel_url):
+        if not _YOUTUBE_URL_RE.match(channel_url):
             QMessageBox.warning(self, "Invalid URL", "Please enter a valid YouTube channel URL.")
             return
 
@@ -527,17 +747,69 @@ class YouTubeViewStatsApp(QWidget):
 
         # Process the channel
         self.log(f"Starting analysis for {channel_url}")
-        worker = WorkerThread(self.youtube, channel_url, n_videos)
-        worker.progress.connect(self.log)
-        worker.finished.connect(self.handle_worker_finished)
-        self.worker_threads.append(worker)
-        worker.start()
+        future = asyncio.run_coroutine_threadsafe(self._analyze(channel_url, n_videos), self._loop)
+        future.add_done_callback(self._analysis_done)
 
-    def handle_worker_finished(self, data):
-        worker = self.sender()
-        if worker in self.worker_threads:
-            self.worker_threads.remove(worker)
+    def _progress(self, message):
+        # Called from the event loop thread; marshal the message to the GUI thread
+        QMetaObject.invokeMethod(self, "log", Qt.ConnectionType.QueuedConnection, Q_ARG(str, message))
+
+    def _analysis_done(self, future):
+        try:
+            data = future.result()
+        except Exception as e:
+            data = {'error': str(e)}
+        QMetaObject.invokeMethod(self, "handle_worker_finished", Qt.ConnectionType.QueuedConnection,
+                                 Q_ARG(object, data))
+
+    def _get_session(self):
+        # Created lazily on the loop thread so it binds to the shared event loop
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def _close_session(self):
+        if self._session is not None:
+            await self._session.close()
+
+    async def _analyze(self, channel_url, n_videos):
+        try:
+            session = self._get_session()
+            self._progress(f"Processing channel: {channel_url}")
+            channel_id = await extract_channel_id(session, self.api_key, channel_url)
+            self._progress(f"Extracted Channel ID: {channel_id}")
+
+            uploads_playlist_id, channel_title = await get_uploads_playlist_id(session, self.api_key, channel_id)
+            self._progress(f"Channel Title: {channel_title}")
+
+            # Statistics batches are requested as soon as each playlist page arrives
+            queue = asyncio.Queue()
+            if n_videos == "all":
+                self._progress("Fetching all video IDs and statistics...")
+                fetch_ids = get_all_video_ids(session, self.api_key, uploads_playlist_id, queue=queue)
+            else:
+                self._progress(f"Fetching last {n_videos} video IDs and statistics...")
+                fetch_ids = get_last_n_video_ids(session, self.api_key, uploads_playlist_id, n=n_videos, queue=queue)
+            producer = asyncio.create_task(fetch_ids)
+            consumer = asyncio.create_task(stream_videos_statistics(session, self.api_key, queue))
+            try:
+                video_ids, video_stats = await asyncio.gather(producer, consumer)
+            except Exception:
+                # Don't keep spending quota on the other half of the pipeline
+                producer.cancel()
+                consumer.cancel()
+                raise
+            self._progress(f"Total Videos Retrieved: {len(video_ids)}")
+            self._progress("Video statistics retrieved.")
+            return {
+                'channel_title': channel_title,
+                'video_stats': video_stats
+            }
+        except Exception as e:
+            return {'error': str(e)}
 
+    @pyqtSlot(object)
+    def handle_worker_finished(self, data):
         if 'error' in data:
             self.log(f"Error: {data['error']}")
             QMessageBox.critical(self, "Error", data['error'])
@@ -548,47 +820,58 @@ class YouTubeViewStatsApp(QWidget):
 
         self.latest_channel_title = channel_title
 
-        if not video_stats:
+        if len(video_stats['video_id']) == 0:
             self.log(f"No video statistics available for {channel_title}.")
             QMessageBox.warning(self, "No Data", f"No video statistics available for {channel_title}.")
             return
 
-        # Create a DataFrame
+        # Create a DataFrame from the column arrays (upload_date is already datetime64)
         df = pd.DataFrame(video_stats)
-        # Convert upload_date to datetime
-        df['upload_date'] = pd.to_datetime(df['upload_date'])
-        # Remove timezone information if present
-        if df['upload_date'].dt.tz is not None:
-            df['upload_date'] = df['upload_date'].dt.tz_convert(None)
         # Sort by upload_date
         df.sort_values('upload_date', inplace=True)
 
         # Calculate moving average (window size of 5 or 10% of data length)
         window_size = max(1, len(df) // 10)  # Adjust window size based on data length
-        df['moving_avg'] = df['view_count'].rolling(window=window_size).mean()
+        df['moving_avg'] = moving_average(df['view_count'].to_numpy(), window_size)
+
+        # Downcast numeric columns to halve memory for charting and export.
+        # Some videos exceed 2**31 views, so only narrow view_count when it fits.
+        if df['view_count'].max() <= np.iinfo(np.int32).max:
+            df['view_count'] = df['view_count'].astype(np.int32)
+        df['moving_avg'] = df['moving_avg'].astype(np.float32)
 
-        self.latest_df = df.copy()  # Store the latest DataFrame for export
+        # Store the latest DataFrame for export. No copy is made: df is not used
+        # elsewhere, and latest_df must be treated as read-only from here on.
+        self.latest_df = df
 
         # Plotting using PyQt6.QtCharts
         chart = QChart()
         chart.setTitle(f"View Counts for {channel_title}")
         chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
 
+        # Large channels are drawn on the GPU; OpenGL series cannot show point markers
+        use_opengl = len(df) > OPENGL_POINT_THRESHOLD
+
         # Series for View Count
         view_series = QLineSeries()
         view_series.setName("View Count")
-        view_series.setPointsVisible(True)
+        view_series.setUseOpenGL(use_opengl)
+        view_series.setPointsVisible(not use_opengl)
 
         # Series for Moving Average
         avg_series = QLineSeries()
         avg_series.setName("Moving Average")
-        avg_series.setPointsVisible(True)
-
-        for index, row in df.iterrows():
-            timestamp = row['upload_date'].timestamp() * 1000  # Convert to milliseconds
-            view_series.append(timestamp, row['view_count'])
-            if not pd.isna(row['moving_avg']):
-                avg_series.append(timestamp, row['moving_avg'])
+        avg_series.setUseOpenGL(use_opengl)
+        avg_series.setPointsVisible(not use_opengl)
+
+        # Build all points up front and hand them to each series in one call,
+        # decimating large channels so only ~MAX_CHART_POINTS are drawn
+        timestamps = (df['upload_date'].astype('int64') // 10**6).to_numpy()  # Convert to milliseconds
+        view_counts = df['view_count'].to_numpy()
+        moving_avg = df['moving_avg'].to_numpy()
+        valid = ~np.isnan(moving_avg)
+        view_series.replace(chart_points(timestamps, view_counts))
+        avg_series.replace(chart_points(timestamps[valid], moving_avg[valid]))
 
         chart.addSeries(view_series)
         chart.addSeries(avg_series)
@@ -619,17 +902,27 @@ class YouTubeViewStatsApp(QWidget):
         chart_view = InteractiveChartView(chart)
         chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        # Re-decimate for the visible range when zooming into large channels
+        if len(df) > MAX_CHART_POINTS:
+            chart_view.track_series(view_series, timestamps, view_counts)
+            chart_view.track_series(avg_series, timestamps[valid], moving_avg[valid])
+            axis_x.rangeChanged.connect(chart_view.refresh_visible_points)
+
         # Enable zooming and panning
         chart_view.setRubberBand(QChartView.RubberBand.RectangleRubberBand)
         chart_view.setInteractive(True)
 
-        # Add shadow effect for aesthetics
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setXOffset(5)
-        shadow.setYOffset(5)
-        shadow.setColor(QColor("#000000"))
-        chart_view.setGraphicsEffect(shadow)
+        if use_opengl:
+            # Render the whole scene through an OpenGL viewport
+            chart_view.setViewport(QOpenGLWidget())
+        else:
+            # Add shadow effect for aesthetics (graphics effects are not supported on OpenGL viewports)
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(10)
+            shadow.setXOffset(5)
+            shadow.setYOffset(5)
+            shadow.setColor(QColor("#000000"))
+            chart_view.setGraphicsEffect(shadow)
 
         self.scroll_layout.addWidget(chart_view)
 
@@ -639,32 +932,44 @@ class YouTubeViewStatsApp(QWidget):
     def show_tooltip(self, point, state, series_name):
         if state:
             try:
-                date = datetime.fromtimestamp(point.x() / 1000).strftime("%Y-%m-%d")
+                # Timestamps are UTC milliseconds since the epoch
+                date = time.strftime("%Y-%m-%d", time.gmtime(point.x() / 1000))
                 value = int(point.y())
-                QToolTip.setFont(QFont('SansSerif', 10))
                 QToolTip.showText(QCursor.pos(), f"{series_name} on {date}: {value} views", self)
             except Exception as e:
                 logging.error(f"Error showing tooltip: {e}")
 
+    def clear_cache(self):
+        try:
+            CACHE.clear()
+            self.log("Cache cleared.")
+        except Exception as e:
+            logging.error(f"Error clearing cache: {e}")
+            QMessageBox.critical(self, "Error", f"An error occurred while clearing the cache:\n{e}")
+
     def export_to_excel(self):
         if self.latest_df is None or self.latest_channel_title == "":
             QMessageBox.warning(self, "No Data", "There is no data to export. Please analyze a channel first.")
             return
 
         try:
-            # Create a new Excel workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Video Statistics"
-
-            # Write DataFrame to Excel
-            for r in dataframe_to_rows(self.latest_df, index=False, header=True):
-                ws.append(r)
+            # Create a new write-only Excel workbook so rows are streamed instead of held in memory
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Video Statistics")
 
-            # Apply header styles
+            # Write the styled header row first; write-only cells cannot be restyled later
             header_font = Font(bold=True)
-            for cell in ws[1]:
+            header = []
+            for column in self.latest_df.columns:
+                cell = WriteOnlyCell(ws, value=str(column))
                 cell.font = header_font
+                header.append(cell)
+            ws.append(header)
+
+            # Write DataFrame to Excel
+            for r in dataframe_to_rows(self.latest_df, index=False, header=False):
+                ws.append(r)
+            max_row = len(self.latest_df) + 1
 
             # Create a Line Chart
             chart = LineChart()
@@ -674,8 +979,8 @@ class YouTubeViewStatsApp(QWidget):
             chart.x_axis.title = 'Upload Date'
 
             # Define data for the chart
-            data = Reference(ws, min_col=3, min_row=1, max_col=4, max_row=ws.max_row)
-            cats = Reference(ws, min_col=1, min_row=2, max_row=ws.max_row)
+            data = Reference(ws, min_col=3, min_row=1, max_col=4, max_row=max_row)
+            cats = Reference(ws, min_col=1, min_row=2, max_row=max_row)
             chart.add_data(data, titles_from_data=True)
             chart.set_categories(cats)
             chart.width = 20
@@ -686,7 +991,7 @@ class YouTubeViewStatsApp(QWidget):
 
             # Generate filename
             current_date = datetime.now().strftime("%Y%m%d")
-            sanitized_channel_title = re.sub(r'[\\/*?:"<>|]', "", self.latest_channel_title)
+            sanitized_channel_title = self.latest_channel_title.translate(_BAD_FILENAME_CHARS)
             filename = f"{sanitized_channel_title}-{self.latest_n_videos}-{current_date}.xlsx"
 
             # Save the workbook
@@ -699,18 +1004,21 @@ class YouTubeViewStatsApp(QWidget):
 
     def clear_layout(self, layout):
         if layout is not None:
-            while layout.count():
-                child = layout.takeAt(0)
-                if child.widget() is not None:
-                    child.widget().setParent(None)
+            # deleteLater batches teardown into the next event loop iteration
+            while (child := layout.takeAt(0)) is not None:
+                widget = child.widget()
+                if widget is not None:
+                    widget.deleteLater()
                 elif child.layout() is not None:
                     self.clear_layout(child.layout())
 
     def closeEvent(self, event):
-        # Stop all running threads when the application is closed
-        for worker in self.worker_threads:
-            worker.quit()
-            worker.wait()
+        # Close the shared HTTP session, then stop the background event loop
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_session(), self._loop).result(timeout=5)
+        except Exception as e:
+            logging.error(f"Error closing HTTP session: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
         event.accept()
 
 